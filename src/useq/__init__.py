@@ -1,43 +1,45 @@
 """Implementation agnostic schema for multi-dimensional microscopy experiments."""
 
 import warnings
-from typing import Any
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from useq._actions import AcquireImage, Action, HardwareAutofocus
-from useq._channel import Channel
-from useq._grid import (
-    GridFromEdges,
-    GridRowsColumns,
-    GridWidthHeight,
-    MultiPointPlan,
-    RandomPoints,
-    RelativeMultiPointPlan,
-    Shape,
-)
-from useq._hardware_autofocus import AnyAutofocusPlan, AutoFocusPlan, AxesBasedAF
-from useq._mda_event import Channel as EventChannel
-from useq._mda_event import MDAEvent, PropertyTuple, SLMImage
-from useq._mda_sequence import MDASequence
-from useq._plate import WellPlate, WellPlatePlan
-from useq._plate_registry import register_well_plates, registered_well_plate_keys
-from useq._point_visiting import OrderMode, TraversalOrder
-from useq._position import AbsolutePosition, Position, RelativePosition
-from useq._time import (
-    AnyTimePlan,
-    MultiPhaseTimePlan,
-    TDurationLoops,
-    TIntervalDuration,
-    TIntervalLoops,
-)
-from useq._utils import Axis
-from useq._z import (
-    AnyZPlan,
-    ZAboveBelow,
-    ZAbsolutePositions,
-    ZRangeAround,
-    ZRelativePositions,
-    ZTopBottom,
-)
+if TYPE_CHECKING:
+    from useq._actions import AcquireImage, Action, HardwareAutofocus
+    from useq._channel import Channel
+    from useq._grid import (
+        GridFromEdges,
+        GridRowsColumns,
+        GridWidthHeight,
+        MultiPointPlan,
+        RandomPoints,
+        RelativeMultiPointPlan,
+        Shape,
+    )
+    from useq._hardware_autofocus import AnyAutofocusPlan, AutoFocusPlan, AxesBasedAF
+    from useq._mda_event import Channel as EventChannel
+    from useq._mda_event import MDAEvent, PropertyTuple, SLMImage
+    from useq._mda_sequence import MDASequence
+    from useq._plate import WellPlate, WellPlatePlan
+    from useq._plate_registry import register_well_plates, registered_well_plate_keys
+    from useq._point_visiting import OrderMode, TraversalOrder
+    from useq._position import AbsolutePosition, Position, RelativePosition
+    from useq._time import (
+        AnyTimePlan,
+        MultiPhaseTimePlan,
+        TDurationLoops,
+        TIntervalDuration,
+        TIntervalLoops,
+    )
+    from useq._utils import Axis
+    from useq._z import (
+        AnyZPlan,
+        ZAboveBelow,
+        ZAbsolutePositions,
+        ZRangeAround,
+        ZRelativePositions,
+        ZTopBottom,
+    )
 
 __all__ = [
     "AbsolutePosition",
@@ -83,12 +85,80 @@ __all__ = [
     "registered_well_plate_keys",
 ]
 
+# Public names are imported lazily (PEP 562) from the private module that defines
+# them, so that `import useq` does not pay for building every pydantic model.
+# maps public name -> (module, attribute)
+_LAZY: dict[str, tuple[str, str]] = {
+    "AbsolutePosition": ("useq._position", "AbsolutePosition"),
+    "AcquireImage": ("useq._actions", "AcquireImage"),
+    "Action": ("useq._actions", "Action"),
+    "AnyAutofocusPlan": ("useq._hardware_autofocus", "AnyAutofocusPlan"),
+    "AnyTimePlan": ("useq._time", "AnyTimePlan"),
+    "AnyZPlan": ("useq._z", "AnyZPlan"),
+    "AutoFocusPlan": ("useq._hardware_autofocus", "AutoFocusPlan"),
+    "AxesBasedAF": ("useq._hardware_autofocus", "AxesBasedAF"),
+    "Axis": ("useq._utils", "Axis"),
+    "Channel": ("useq._channel", "Channel"),
+    "EventChannel": ("useq._mda_event", "Channel"),
+    "GridFromEdges": ("useq._grid", "GridFromEdges"),
+    "GridRowsColumns": ("useq._grid", "GridRowsColumns"),
+    "GridWidthHeight": ("useq._grid", "GridWidthHeight"),
+    "HardwareAutofocus": ("useq._actions", "HardwareAutofocus"),
+    "MDAEvent": ("useq._mda_event", "MDAEvent"),
+    "MDASequence": ("useq._mda_sequence", "MDASequence"),
+    "MultiPhaseTimePlan": ("useq._time", "MultiPhaseTimePlan"),
+    "MultiPointPlan": ("useq._grid", "MultiPointPlan"),
+    "OrderMode": ("useq._point_visiting", "OrderMode"),
+    "Position": ("useq._position", "Position"),
+    "PropertyTuple": ("useq._mda_event", "PropertyTuple"),
+    "RandomPoints": ("useq._grid", "RandomPoints"),
+    "RelativeMultiPointPlan": ("useq._grid", "RelativeMultiPointPlan"),
+    "RelativePosition": ("useq._position", "RelativePosition"),
+    "SLMImage": ("useq._mda_event", "SLMImage"),
+    "Shape": ("useq._grid", "Shape"),
+    "TDurationLoops": ("useq._time", "TDurationLoops"),
+    "TIntervalDuration": ("useq._time", "TIntervalDuration"),
+    "TIntervalLoops": ("useq._time", "TIntervalLoops"),
+    "TraversalOrder": ("useq._point_visiting", "TraversalOrder"),
+    "WellPlate": ("useq._plate", "WellPlate"),
+    "WellPlatePlan": ("useq._plate", "WellPlatePlan"),
+    "ZAboveBelow": ("useq._z", "ZAboveBelow"),
+    "ZAbsolutePositions": ("useq._z", "ZAbsolutePositions"),
+    "ZRangeAround": ("useq._z", "ZRangeAround"),
+    "ZRelativePositions": ("useq._z", "ZRelativePositions"),
+    "ZTopBottom": ("useq._z", "ZTopBottom"),
+    "register_well_plates": ("useq._plate_registry", "register_well_plates"),
+    "registered_well_plate_keys": (
+        "useq._plate_registry",
+        "registered_well_plate_keys",
+    ),
+}
 
-MDAEvent.model_rebuild()
-Position.model_rebuild()
+# Modules whose models only work once `MDASequence` exists (they have a forward
+# reference to it, directly or through `Position`/`MDAEvent`).  The models are
+# rebuilt at the bottom of `useq._mda_sequence`, so it is imported along with them.
+_STANDALONE_MODULES = frozenset(
+    {
+        "useq._actions",
+        "useq._channel",
+        "useq._plate_registry",
+        "useq._point_visiting",
+        "useq._time",
+        "useq._utils",
+        "useq._z",
+    }
+)
 
 
 def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        module_name, attr_name = _LAZY[name]
+        obj = getattr(import_module(module_name), attr_name)
+        if module_name not in _STANDALONE_MODULES:
+            import_module("useq._mda_sequence")
+        # cache on the module, so that __getattr__ is only hit once per name
+        globals()[name] = obj
+        return obj
     if name == "GridRelative":
         from useq._grid import GridRowsColumns
 
@@ -105,5 +175,7 @@ def __getattr__(name: str) -> Any:
             DeprecationWarning,
             stacklevel=2,
         )
+        from useq._grid import MultiPointPlan
+
         return MultiPointPlan
     raise AttributeError(f"module {__name__} has no attribute {name}")
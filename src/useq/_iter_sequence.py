@@ -3,10 +3,11 @@ from __future__ import annotations
 from functools import cache
 from itertools import product
 from types import MappingProxyType
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, cast
 
 from typing_extensions import TypedDict
 
+from useq._actions import AcquireImage
 from useq._channel import Channel  # noqa: TC001  # noqa: TCH001
 from useq._mda_event import Channel as EventChannel
 from useq._mda_event import MDAEvent
@@ -16,6 +17,7 @@ from useq._z import AnyZPlan  # noqa: TC001  # noqa: TCH001
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    from useq._hardware_autofocus import AnyAutofocusPlan
     from useq._mda_sequence import MDASequence
     from useq._position import Position, PositionBase, RelativePosition
 
@@ -41,6 +43,12 @@ class PositionDict(TypedDict, total=False):
     z_pos: float
 
 
+# Actions are immutable, so every event built by `_iter_sequence` can share a single
+# instance of the default action, rather than validating a new `AcquireImage()` (the
+# `MDAEvent.action` default factory) for each event.
+_ACQUIRE_IMAGE = AcquireImage()
+
+
 @cache
 def _iter_axis(seq: MDASequence, ax: str) -> tuple[Channel | float | PositionBase, ...]:
     return tuple(seq.iter_axis(ax))
@@ -48,7 +56,7 @@ def _iter_axis(seq: MDASequence, ax: str) -> tuple[Channel | float | PositionBas
 
 @cache
 def _sizes(seq: MDASequence) -> dict[str, int]:
-    return {k: len(list(_iter_axis(seq, k))) for k in seq.axis_order}
+    return {k: len(_iter_axis(seq, k)) for k in seq.axis_order}
 
 
 @cache
@@ -56,6 +64,19 @@ def _used_axes(seq: MDASequence) -> str:
     return "".join(k for k in seq.axis_order if _sizes(seq)[k])
 
 
+@cache
+def _with_autofocus_plan(
+    seq: MDASequence, autofocus_plan: AnyAutofocusPlan | None
+) -> MDASequence:
+    """Return a copy of `seq` that uses `autofocus_plan`.
+
+    This is cached so that the same copy is reused every time we recurse into a
+    position sub-sequence: its axes are then materialized only once (by the caches
+    above) rather than once per parent event.
+    """
+    return seq.model_copy(update={"autofocus_plan": autofocus_plan})
+
+
 def iter_sequence(sequence: MDASequence) -> Iterator[MDAEvent]:
     """Iterate over all events in the MDA sequence.'.
 
@@ -146,31 +167,56 @@ def _iter_sequence(
         Each event in the MDA sequence.
     """
     order = _used_axes(sequence)
+    # these are fixed for the lifetime of this sequence: look them up once,
+    # rather than once per event.
+    slots = _axis_slots(order)
+    z_plan = sequence.z_plan
+    # index of the middle z plane (used for channels with do_stack=False)
+    z_middle = z_plan.num_positions() // 2 if z_plan is not None else None
+    sequence_af_plan = sequence.autofocus_plan
+    # index of the parent event (if any), onto which each event's index is layered
+    base_index = base_event_kwargs.get("index") if base_event_kwargs else None
+    # materialized values for each used axis.  We iterate over the product of
+    # integer indices (a C-level odometer) and look values up by position, rather
+    # than building (index, value) pairs for every axis of every event.
     # this needs to be tuple(...) to work for mypyc
-    axis_iterators = tuple(enumerate(_iter_axis(sequence, ax)) for ax in order)
-    for item in product(*axis_iterators):
-        if not item:  # the case with no events
+    values = tuple(_iter_axis(sequence, ax) for ax in order)
+    # position of each axis in `order` (None for unused axes)
+    slot_of = dict(slots)
+    t_i, p_i, g_i, c_i, z_i = (slot_of.get(ax) for ax in AXES)
+    # loop-invariant lookups, bound to locals so the loop body doesn't repeat them
+    offsets = tuple(position_offsets.items()) if position_offsets else ()
+    t_key = Axis.TIME
+    construct_event = MDAEvent.model_construct
+    construct_channel = EventChannel.model_construct
+    for indices in product(*(range(len(v)) for v in values)):
+        if not indices:  # the case with no events
             continue  # pragma: no cover
-        # get axes objects for this event
-        index, time, position, grid, channel, z_pos = _parse_axes(zip(order, item))
-
-        # skip if necessary
-        if _should_skip(position, channel, index, sequence.z_plan):
+        index: dict[str, int] = {ax: indices[i] for ax, i in slots}
+        # the skip check only needs the index, position and channel, so evaluate it
+        # before looking up (and later combining) the values of the remaining axes
+        position = values[p_i][indices[p_i]] if p_i is not None else None
+        channel = values[c_i][indices[c_i]] if c_i is not None else None
+        if _should_skip(position, channel, index, z_middle):
             continue
 
+        time = values[t_i][indices[t_i]] if t_i is not None else None
+        grid = values[g_i][indices[g_i]] if g_i is not None else None
+        z_pos = values[z_i][indices[z_i]] if z_i is not None else None
+
         # build kwargs that will be passed to this MDAEvent
         event_kwargs = base_event_kwargs or MDAEventDict(sequence=sequence)
-        # the .update() here lets us build on top of the base_event.index if present
-
+        # build on top of the base_event.index if present.  `index` is a fresh dict
+        # for each event, so it can be wrapped directly when there is nothing to merge
         event_kwargs["index"] = MappingProxyType(
-            {**event_kwargs.get("index", {}), **index}  # type: ignore
+            {**base_index, **index} if base_index else index
         )
         # determine x, y, z positions
-        event_kwargs.update(_xyzpos(position, channel, sequence.z_plan, grid, z_pos))
+        event_kwargs.update(_xyzpos(position, channel, z_plan, grid, z_pos))
         if position and position.name:
             event_kwargs["pos_name"] = position.name
         if channel:
-            event_kwargs["channel"] = EventChannel.model_construct(
+            event_kwargs["channel"] = construct_channel(
                 config=channel.config, group=channel.group
             )
             if channel.exposure is not None:
@@ -184,13 +230,12 @@ def _iter_sequence(
 
         # shift positions if position_offsets have been provided
         # (usually from sub-sequences)
-        if position_offsets:
-            for k, v in position_offsets.items():
-                if event_kwargs[k] is not None:  # type: ignore[literal-required]
-                    event_kwargs[k] += v  # type: ignore[literal-required]
+        for k, v in offsets:
+            if event_kwargs[k] is not None:  # type: ignore[literal-required]
+                event_kwargs[k] += v  # type: ignore[literal-required]
 
         # grab global autofocus plan (may be overridden by position-specific plan below)
-        autofocus_plan = sequence.autofocus_plan
+        autofocus_plan = sequence_af_plan
 
         # if a position has been declared with a sub-sequence, we recurse into it
         if position:
@@ -207,9 +252,7 @@ def _iter_sequence(
                 # if the sub-sequence doe not have an autofocus plan, we override it
                 # with the parent sequence's autofocus plan
                 if not sub_seq.autofocus_plan:
-                    sub_seq = sub_seq.model_copy(
-                        update={"autofocus_plan": autofocus_plan}
-                    )
+                    sub_seq = _with_autofocus_plan(sub_seq, autofocus_plan)
 
                 # recurse into the sub-sequence
                 yield from _iter_sequence(
@@ -226,15 +269,18 @@ def _iter_sequence(
             elif position.sequence is not None and position.sequence.autofocus_plan:
                 autofocus_plan = position.sequence.autofocus_plan
 
-        if event_kwargs["index"].get(Axis.TIME) == 0 and _last_t_idx != 0:
+        if event_kwargs["index"].get(t_key) == 0 and _last_t_idx != 0:
             event_kwargs["reset_event_timer"] = True
-        event = MDAEvent.model_construct(**event_kwargs)
+        # `_fields_set` excludes `action`, so that it still serializes as a default
+        event = construct_event(
+            _fields_set=set(event_kwargs), action=_ACQUIRE_IMAGE, **event_kwargs
+        )
         if autofocus_plan:
             af_event = autofocus_plan.event(event)
             if af_event:
                 yield af_event
         yield event
-        _last_t_idx = event.index.get(Axis.TIME, _last_t_idx)
+        _last_t_idx = event.index.get(t_key, _last_t_idx)
 
 
 # ###################### Helper functions ######################
@@ -265,47 +311,34 @@ def _position_offsets(
     return overrides, offsets
 
 
-def _parse_axes(
-    event: zip[tuple[str, Any]],
-) -> tuple[
-    dict[str, int],
-    float | None,  # time
-    Position | None,
-    RelativePosition | None,
-    Channel | None,
-    float | None,  # z
-]:
-    """Parse an individual event from the product of axis iterators.
+@cache
+def _axis_slots(order: str) -> tuple[tuple[Axis, int], ...]:
+    """Return `(axis, position)` pairs mapping each used axis to its spot in `order`.
 
-    Returns typed objects for each axis, and the index of the event.
+    Pairs are returned in canonical `AXES` order, so that they can be used to pick
+    items out of the tuples yielded by `product(...)` in `_iter_sequence`.
     """
-    # NOTE: this is currently the biggest time sink in iter_sequence.
-    # It is called for every event and takes ~40% of the cumulative time.
-    _ev = dict(event)
-    index = {ax: _ev[ax][0] for ax in AXES if ax in _ev}
-    # this needs to be tuple(...) to work for mypyc
-    axes = tuple(_ev[ax][1] if ax in _ev else None for ax in AXES)
-    return (index, *axes)  # type: ignore [return-value]
+    return tuple((ax, order.index(ax)) for ax in AXES if ax in order)
 
 
 def _should_skip(
     position: Position | None,
     channel: Channel | None,
     index: dict[str, int],
-    z_plan: AnyZPlan | None,
+    z_middle: int | None,
 ) -> bool:
-    """Return True if this event should be skipped."""
+    """Return True if this event should be skipped.
+
+    `z_middle` is the index of the middle plane of the sequence's z_plan (or None if
+    there is no z_plan), computed once per sequence by the caller.
+    """
     if channel:
         # skip channels
         if Axis.TIME in index and index[Axis.TIME] % channel.acquire_every:
             return True
 
         # only acquire on the middle plane:
-        if (
-            not channel.do_stack
-            and z_plan is not None
-            and index[Axis.Z] != z_plan.num_positions() // 2
-        ):
+        if not channel.do_stack and z_middle is not None and index[Axis.Z] != z_middle:
             return True
 
     if (
@@ -19,6 +19,7 @@ from useq._channel import Channel
 from useq._grid import MultiPointPlan  # noqa: TC001
 from useq._hardware_autofocus import AnyAutofocusPlan, AxesBasedAF
 from useq._iter_sequence import iter_sequence
+from useq._mda_event import MDAEvent
 from useq._plate import WellPlatePlan
 from useq._position import Position, PositionBase
 from useq._time import AnyTimePlan  # noqa: TC001
@@ -28,7 +29,15 @@ from useq._z import AnyZPlan  # noqa: TC001
 if TYPE_CHECKING:
     from typing_extensions import Self
 
-    from useq._mda_event import MDAEvent
+
+# name of the MDASequence field that holds the plan for each axis
+_AXIS_FIELDS: dict[str, str] = {
+    str(Axis.TIME): "time_plan",
+    str(Axis.POSITION): "stage_positions",
+    str(Axis.Z): "z_plan",
+    str(Axis.CHANNEL): "channels",
+    str(Axis.GRID): "grid_plan",
+}
 
 
 class MDASequence(UseqModel):
@@ -420,13 +429,7 @@ class MDASequence(UseqModel):
 
     def iter_axis(self, axis: str) -> Iterator[Channel | float | PositionBase]:
         """Iterate over the positions or items of a given axis."""
-        plan = {
-            str(Axis.TIME): self.time_plan,
-            str(Axis.POSITION): self.stage_positions,
-            str(Axis.Z): self.z_plan,
-            str(Axis.CHANNEL): self.channels,
-            str(Axis.GRID): self.grid_plan,
-        }[str(axis).lower()]
+        plan = getattr(self, _AXIS_FIELDS[str(axis).lower()])
         if plan:
             yield from plan
 
@@ -468,3 +471,9 @@ class MDASequence(UseqModel):
                 takes to acquire the data
         """
         return estimate_sequence_duration(self)
+
+
+# `MDAEvent` and `Position` have forward references to `MDASequence`, which can only
+# be resolved now that it has been defined.
+MDAEvent.model_rebuild()
+Position.model_rebuild()
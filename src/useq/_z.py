@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 from typing import TYPE_CHECKING, Callable, Union
 
 import numpy as np
@@ -17,6 +18,19 @@ def _list_cast(field: str) -> Callable:
     return v(list)
 
 
+@lru_cache(maxsize=128)
+def _range_positions(start: float, stop: float, step: float) -> tuple[float, ...]:
+    """Return the positions from `start` to `stop` (inclusive) in steps of `step`.
+
+    Cached, since the same plan is iterated repeatedly (e.g. once per event when
+    looking up the z position of an autofocus event).
+    """
+    if step == 0:
+        return (start,)
+    stop += step / 2  # make sure we include the last point
+    return tuple(float(x) for x in np.arange(start, stop, step))
+
+
 class ZPlan(FrozenModel):
     go_up: bool = True
 
@@ -30,11 +44,7 @@ class ZPlan(FrozenModel):
         raise NotImplementedError
 
     def positions(self) -> Sequence[float]:
-        start, stop, step = self._start_stop_step()
-        if step == 0:
-            return [start]
-        stop += step / 2  # make sure we include the last point
-        return [float(x) for x in np.arange(start, stop, step)]
+        return list(_range_positions(*self._start_stop_step()))
 
     def num_positions(self) -> int:
         start, stop, step = self._start_stop_step()
@@ -141,3 +141,18 @@ def test_time_estimation_with_position_seqs(seq: useq.MDASequence) -> None:
     if not isinstance(expect, tuple):
         expect = (expect, False)
     assert _duration_exceeded(seq) == expect
+
+
+def test_lazy_imports() -> None:
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; from useq import Channel, TIntervalLoops; "
+        "assert 'useq._mda_sequence' not in sys.modules; "
+        "from useq import MDAEvent; MDAEvent(); "
+        "assert 'useq._mda_sequence' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+    for name in useq.__all__:
+        assert getattr(useq, name) is not None